@@ -8,358 +8,116 @@ multiple types per span, and repeated entities.
 
 Usage:
     python entity_markup_converter.py input.jsonl output.html
+    python entity_markup_converter.py -j 4 input.jsonl - > output.html
+
+Options:
+    -j/--workers N   worker processes (default: one per CPU; 1 runs in-process)
+    --summary-only   only report the overall precision/recall/F1
+    --client-render  embed each passage once and highlight it in the browser
+    output of '-'    write the report to stdout
 """
 
 import json
 import argparse
 import html
-from typing import List, Dict, Set, Tuple, Optional
-from dataclasses import dataclass
-from collections import defaultdict, Counter
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Set, Tuple, Optional, TextIO, Iterator, Callable
+from dataclasses import dataclass, field
+from collections import defaultdict, Counter, deque
+from operator import attrgetter
+from functools import lru_cache
+from bisect import bisect_left
 import re
 
+try:
+    import ahocorasick  # optional: pyahocorasick, single-pass multi-span search
+except ImportError:
+    ahocorasick = None
 
-@dataclass
-class EntitySpan:
-    """Represents an entity span with its position and metadata."""
-    start: int
-    end: int
-    text: str
-    types: List[str]
-    source: str  # 'ground_truth', 'mistral', 'gpt4'
-    occurrence_id: int = 0  # For tracking repeated spans
+try:
+    import orjson  # optional: faster JSONL parsing
+    _json_loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+        _json_loads = ujson.loads
+    except ImportError:
+        _json_loads = json.loads
 
+try:
+    from markupsafe import escape as _markupsafe_escape  # optional: single-pass C escaping
 
-@dataclass
-class ComparisonResult:
-    """Results of comparing entity annotations."""
-    exact_matches: int = 0
-    partial_matches: int = 0
-    type_mismatches: int = 0
-    ground_truth_only: int = 0
-    model_only: int = 0
-    total_ground_truth: int = 0
-    total_model: int = 0
+    def _escape_chars(text: str) -> str:
+        """HTML-escape a string with markupsafe."""
+        return str(_markupsafe_escape(text))
+except ImportError:
+    _escape_chars = html.escape
 
 
-class EntityMarkupConverter:
-    """Converts JSONL entity data to HTML markup."""
-    
-    def __init__(self):
-        self.entity_colors = {
-            'E21 Person': '#FF6B6B',
-            'E53 Place': '#4ECDC4', 
-            'E52 Time-Span': '#45B7D1',
-            'E54 Dimension': '#96CEB4',
-            'E19 Physical Thing': '#FFEAA7',
-            'E74 Group': '#DDA0DD',
-            'E86 Leaving': '#F39C12',
-            'E9 Move': '#E17055',
-            'F2 Expression': '#A29BFE',
-            'E31 Document': '#FD79A8',
-            'E55 Type': '#FDCB6E',
-            'E7 Activity': '#6C5CE7',
-            'default': '#BDC3C7'
-        }
-        
-        self.source_labels = {
-            'ground_truth': 'Ground Truth',
-            'mistral': 'Mistral Small 3.2',
-            'gpt4': 'GPT-4o Mini'
-        }
+# Characters that need escaping, and how many characters escaping adds for each
+_SPECIAL_CHARS_RE = re.compile(r'[&<>"\']')
+_ESCAPE_GROWTH = {char: len(_escape_chars(char)) - 1 for char in '&<>"\''}
 
-    def find_all_occurrences(self, text: str, span_text: str) -> List[Tuple[int, int]]:
-        """Find all occurrences of a span in the text."""
-        occurrences = []
-        start = 0
-        while True:
-            pos = text.find(span_text, start)
-            if pos == -1:
-                break
-            occurrences.append((pos, pos + len(span_text)))
-            start = pos + 1
-        return occurrences
 
-    def extract_entities(self, item: Dict) -> List[EntitySpan]:
-        """Extract all entity spans from a JSONL item."""
-        text = item['text']
-        entities = []
-        
-        # Track occurrences of each span text
-        span_counters = defaultdict(int)
-        
-        # Process ground truth
-        for label in item.get('labels', []):
-            span_text = label['span']
-            types = label['types']
-            occurrences = self.find_all_occurrences(text, span_text)
-            
-            for start, end in occurrences:
-                span_counters[span_text] += 1
-                entities.append(EntitySpan(
-                    start=start,
-                    end=end,
-                    text=span_text,
-                    types=types,
-                    source='ground_truth',
-                    occurrence_id=span_counters[span_text]
-                ))
-        
-        # Process model outputs
-        for model_key, source_name in [('mistral_small_3.2_output', 'mistral'), 
-                                       ('gpt_4o_mini_output', 'gpt4')]:
-            span_counters.clear()  # Reset for each model
-            
-            for prediction in item.get(model_key, []):
-                span_text = prediction['span']
-                types = prediction['types']
-                occurrences = self.find_all_occurrences(text, span_text)
-                
-                for start, end in occurrences:
-                    span_counters[span_text] += 1
-                    entities.append(EntitySpan(
-                        start=start,
-                        end=end,
-                        text=span_text,
-                        types=types,
-                        source=source_name,
-                        occurrence_id=span_counters[span_text]
-                    ))
-        
-        return sorted(entities, key=lambda x: (x.start, -x.end))
+# str.translate with an escape table is not used: once it meets the first
+# character that expands it drops to a per-character loop, 30-40x slower
+# than html.escape/markupsafe on typical passages.
+def _escape_text(text: str) -> str:
+    """HTML-escape a run of plain text, passing through runs with nothing to escape."""
+    if '&' in text or '<' in text or '>' in text or '"' in text or "'" in text:
+        return _escape_chars(text)
+    return text
 
-    def resolve_overlaps(self, entities: List[EntitySpan]) -> List[List[EntitySpan]]:
-        """Group overlapping entities together."""
-        if not entities:
-            return []
-        
-        groups = []
-        current_group = [entities[0]]
-        
-        for entity in entities[1:]:
-            # Check if this entity overlaps with any in the current group
-            overlaps = False
-            for group_entity in current_group:
-                if (entity.start < group_entity.end and 
-                    entity.end > group_entity.start):
-                    overlaps = True
-                    break
-            
-            if overlaps:
-                current_group.append(entity)
-            else:
-                groups.append(current_group)
-                current_group = [entity]
-        
-        groups.append(current_group)
-        return groups
 
-    def get_primary_color(self, types: List[str]) -> str:
-        """Get the primary color for an entity based on its types."""
-        for entity_type in types:
-            if entity_type in self.entity_colors:
-                return self.entity_colors[entity_type]
-        return self.entity_colors['default']
-    
-    def get_combined_colors(self, types: List[str]) -> Tuple[str, str]:
-        """Get combined colors for multi-label entities."""
-        if len(types) <= 1:
-            primary = self.get_primary_color(types)
-            return primary, primary
-        
-        # Get colors for all types
-        colors = []
-        for entity_type in types:
-            if entity_type in self.entity_colors:
-                colors.append(self.entity_colors[entity_type])
-        
-        if not colors:
-            return self.entity_colors['default'], self.entity_colors['default']
-        
-        if len(colors) == 1:
-            return colors[0], colors[0]
-        
-        # For multiple colors, create a gradient or pattern
-        primary_color = colors[0]
-        
-        # Create a CSS gradient background for multiple types
-        if len(colors) == 2:
-            gradient = f"linear-gradient(45deg, {colors[0]} 50%, {colors[1]} 50%)"
-        else:
-            # For 3+ colors, create stripes
-            stripe_width = 100 // len(colors)
-            gradient_stops = []
-            for i, color in enumerate(colors):
-                start = i * stripe_width
-                end = (i + 1) * stripe_width
-                gradient_stops.append(f"{color} {start}%, {color} {end}%")
-            gradient = f"linear-gradient(45deg, {', '.join(gradient_stops)})"
-        
-        return primary_color, gradient
+# Below this many entities the array conversion costs more than it saves
+_NUMBA_MIN_ENTITIES = 512
 
-    def format_types(self, types: List[str]) -> str:
-        """Format entity types for display."""
-        return ', '.join(types)
+# numpy and numba are optional and imported on first use, since most items
+# never reach the threshold and the imports dominate short runs
+np = None
+_group_overlaps_nb = None
+_numba_missing = False
 
-    def create_entity_html(self, entity: EntitySpan, is_primary: bool = True) -> str:
-        """Create HTML markup for a single entity with sophisticated multi-label support."""
-        primary_color, background = self.get_combined_colors(entity.types)
-        opacity = '0.8' if is_primary else '0.4'
-        
-        # Create occurrence indicator if needed
-        occurrence_suffix = f"<sup>{entity.occurrence_id}</sup>" if entity.occurrence_id > 1 else ""
-        
-        # Determine multi-label class and styling
-        multi_label_class = ""
-        css_variables = ""
-        type_count_attr = ""
-        
-        if len(entity.types) > 1:
-            multi_label_class = "multi-label"
-            type_count_attr = f'data-type-count="{len(entity.types)}"'
-            
-            # Get colors for CSS variables
-            colors = []
-            for entity_type in entity.types:
-                if entity_type in self.entity_colors:
-                    colors.append(self.entity_colors[entity_type])
-            
-            if len(colors) >= 2:
-                css_variables = f"--primary-color: {colors[0]}; --secondary-color: {colors[1]};"
-                if len(colors) >= 3:
-                    multi_label_class = "triple-label"
-                    css_variables += f" --tertiary-color: {colors[2]};"
-        
-        # Create enhanced tooltip with structured content
-        tooltip_html = f'''
-        <div class="entity-tooltip">
-            <div class="tooltip-section">
-                <span class="tooltip-label">Source:</span> {self.source_labels[entity.source]}
-            </div>
-            <div class="tooltip-section">
-                <span class="tooltip-label">Position:</span> {entity.start}-{entity.end}
-            </div>
-            <div class="tooltip-section">
-                <span class="tooltip-label">Types:</span>
-                <ul class="type-list">
-        '''
-        
-        for entity_type in entity.types:
-            color = self.entity_colors.get(entity_type, self.entity_colors['default'])
-            tooltip_html += f'<li class="type-item" style="border-left: 3px solid {color};">{entity_type}</li>'
-        
-        tooltip_html += '''
-                </ul>
-            </div>
-        </div>
-        '''
-        
-        # Create data attributes for filtering
-        types_attr = f'data-types="{"|".join(entity.types)}"'
-        
-        # Use gradient background for multi-type entities, solid color for single type
-        if len(entity.types) > 1:
-            background_style = f"background: {background};"
+
+def _group_overlaps_sweep(starts, ends):
+    """Assign a group id to each span and find each group's end; spans must be sorted by start."""
+    group_ids = np.empty(len(starts), dtype=np.int32)
+    group_ends = np.empty(len(starts), dtype=np.int32)
+    group_id = 0
+    group_max_end = ends[0]
+    group_ids[0] = 0
+    for i in range(1, len(starts)):
+        if starts[i] < group_max_end:
+            if ends[i] > group_max_end:
+                group_max_end = ends[i]
         else:
-            background_style = f"background-color: {background};"
-        
-        return (
-            f'<span class="entity {entity.source} {multi_label_class}" '
-            f'style="{background_style} {css_variables} opacity: {opacity}; '
-            f'border: 1px solid {primary_color};" '
-            f'{types_attr} {type_count_attr}>'
-            f'{html.escape(entity.text)}{occurrence_suffix}'
-            f'{tooltip_html}'
-            f'</span>'
-        )
+            group_ends[group_id] = group_max_end
+            group_id += 1
+            group_max_end = ends[i]
+        group_ids[i] = group_id
+    group_ends[group_id] = group_max_end
+    return group_ids, group_ends[:group_id + 1]
 
-    def markup_text(self, text: str, entities: List[EntitySpan]) -> str:
-        """Create HTML markup for text with entity highlighting."""
-        if not entities:
-            return html.escape(text)
-        
-        # Group overlapping entities
-        overlap_groups = self.resolve_overlaps(entities)
-        
-        result = []
-        last_pos = 0
-        
-        for group in overlap_groups:
-            # Find the span that covers this group
-            group_start = min(e.start for e in group)
-            group_end = max(e.end for e in group)
-            
-            # Add text before this group
-            if group_start > last_pos:
-                result.append(html.escape(text[last_pos:group_start]))
-            
-            # Handle the group
-            if len(group) == 1:
-                # Single entity, simple case
-                result.append(self.create_entity_html(group[0]))
-            else:
-                # Multiple overlapping entities
-                # Use the longest span as primary, others as secondary
-                primary = max(group, key=lambda x: x.end - x.start)
-                secondaries = [e for e in group if e != primary]
-                
-                # Create nested markup
-                primary_html = self.create_entity_html(primary)
-                
-                # Add secondary entities as additional info
-                secondary_info = []
-                for secondary in secondaries:
-                    secondary_info.append(
-                        f"{self.source_labels[secondary.source]}: "
-                        f"{self.format_types(secondary.types)}"
-                    )
-                
-                if secondary_info:
-                    tooltip_extra = "\\nAlso annotated as:\\n" + "\\n".join(secondary_info)
-                    primary_html = primary_html.replace(
-                        'title="', f'title="{tooltip_extra}\\n'
-                    )
-                
-                result.append(primary_html)
-            
-            last_pos = group_end
-        
-        # Add remaining text
-        if last_pos < len(text):
-            result.append(html.escape(text[last_pos:]))
-        
-        return ''.join(result)
 
-    def compare_annotations(self, ground_truth: List[EntitySpan], 
-                          model_entities: List[EntitySpan]) -> ComparisonResult:
-        """Compare model annotations with ground truth."""
-        result = ComparisonResult()
-        
-        # Convert to sets for comparison
-        gt_spans = {(e.start, e.end, tuple(sorted(e.types))) for e in ground_truth}
-        model_spans = {(e.start, e.end, tuple(sorted(e.types))) for e in model_entities}
-        
-        result.total_ground_truth = len(gt_spans)
-        result.total_model = len(model_spans)
-        result.exact_matches = len(gt_spans & model_spans)
-        result.ground_truth_only = len(gt_spans - model_spans)
-        result.model_only = len(model_spans - gt_spans)
-        
-        # Check for partial matches (same span, different types)
-        gt_positions = {(e.start, e.end) for e in ground_truth}
-        model_positions = {(e.start, e.end) for e in model_entities}
-        
-        overlapping_positions = gt_positions & model_positions
-        exact_match_positions = {(s, e) for s, e, _ in gt_spans & model_spans}
-        
-        result.partial_matches = len(overlapping_positions - exact_match_positions)
-        
-        return result
+def _load_group_overlaps_nb():
+    """Return the JIT-compiled overlap sweep, importing numpy/numba on first call; None if unavailable."""
+    global np, _group_overlaps_nb, _numba_missing
+    if _group_overlaps_nb is None and not _numba_missing:
+        try:
+            import numpy
+            from numba import njit
+        except ImportError:
+            _numba_missing = True
+            return None
+        np = numpy
+        _group_overlaps_nb = njit(cache=True)(_group_overlaps_sweep)
+    return _group_overlaps_nb
 
-    def generate_html_report(self, jsonl_file: str) -> str:
-        """Generate complete HTML report from JSONL file."""
-        
-        html_content = f"""
+
+# Static start of the report: document head with styles and scripts, up to the legend
+_HTML_PROLOGUE = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -367,28 +125,28 @@ class EntityMarkupConverter:
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Entity Extraction Comparison Report</title>
     <style>
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             line-height: 1.6;
             margin: 0;
             padding: 20px;
             background-color: #f5f5f5;
             padding-right: 320px; /* Make room for floating legend */
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background: white;
             padding: 30px;
             border-radius: 10px;
             box-shadow: 0 0 20px rgba(0,0,0,0.1);
-        }}
-        h1, h2, h3 {{
+        }
+        h1, h2, h3 {
             color: #2c3e50;
-        }}
+        }
         
         /* Floating Legend */
-        .floating-legend {{
+        .floating-legend {
             position: fixed;
             top: 20px;
             right: 20px;
@@ -400,9 +158,9 @@ class EntityMarkupConverter:
             z-index: 1000;
             max-height: calc(100vh - 40px);
             overflow-y: auto;
-        }}
+        }
         
-        .legend-header {{
+        .legend-header {
             background: #3498db;
             color: white;
             padding: 12px 15px;
@@ -413,9 +171,9 @@ class EntityMarkupConverter:
             display: flex;
             justify-content: space-between;
             align-items: center;
-        }}
+        }
         
-        .legend-toggle {{
+        .legend-toggle {
             background: none;
             border: none;
             color: white;
@@ -427,35 +185,35 @@ class EntityMarkupConverter:
             display: flex;
             align-items: center;
             justify-content: center;
-        }}
+        }
         
-        .legend-content {{
+        .legend-content {
             padding: 15px;
             transition: all 0.3s ease;
-        }}
+        }
         
-        .legend-content.collapsed {{
+        .legend-content.collapsed {
             display: none;
-        }}
+        }
         
-        .legend-section {{
+        .legend-section {
             margin-bottom: 20px;
-        }}
+        }
         
-        .legend-section:last-child {{
+        .legend-section:last-child {
             margin-bottom: 0;
-        }}
+        }
         
-        .legend-section-title {{
+        .legend-section-title {
             font-weight: bold;
             margin-bottom: 8px;
             color: #2c3e50;
             font-size: 13px;
             text-transform: uppercase;
             letter-spacing: 0.5px;
-        }}
+        }
         
-        .legend-item {{
+        .legend-item {
             display: flex;
             align-items: center;
             margin: 6px 0;
@@ -464,37 +222,37 @@ class EntityMarkupConverter:
             font-size: 12px;
             cursor: pointer;
             transition: all 0.2s ease;
-        }}
+        }
         
-        .legend-item:hover {{
+        .legend-item:hover {
             background: #f8f9fa;
             transform: translateX(2px);
-        }}
+        }
         
-        .legend-item.active {{
+        .legend-item.active {
             background: #e3f2fd;
             border-left: 3px solid #2196f3;
-        }}
+        }
         
-        .legend-color {{
+        .legend-color {
             width: 16px;
             height: 16px;
             border-radius: 3px;
             margin-right: 8px;
             border: 1px solid #ddd;
             flex-shrink: 0;
-        }}
+        }
         
-        .legend-color.multi-type {{
+        .legend-color.multi-type {
             background: linear-gradient(45deg, var(--color1) 50%, var(--color2) 50%);
-        }}
+        }
         
-        .legend-text {{
+        .legend-text {
             flex: 1;
             line-height: 1.2;
-        }}
+        }
         
-        .source-legend-item {{
+        .source-legend-item {
             display: flex;
             align-items: center;
             margin: 6px 0;
@@ -503,47 +261,47 @@ class EntityMarkupConverter:
             font-size: 12px;
             cursor: pointer;
             transition: all 0.2s ease;
-        }}
+        }
         
-        .source-legend-item:hover {{
+        .source-legend-item:hover {
             background: #f8f9fa;
-        }}
+        }
         
-        .source-indicator {{
+        .source-indicator {
             width: 4px;
             height: 16px;
             margin-right: 8px;
             border-radius: 2px;
-        }}
+        }
         
-        .source-indicator.ground_truth {{ background: #27ae60; }}
-        .source-indicator.mistral {{ background: #e74c3c; }}
-        .source-indicator.gpt4 {{ background: #9b59b6; }}
+        .source-indicator.ground_truth { background: #27ae60; }
+        .source-indicator.mistral { background: #e74c3c; }
+        .source-indicator.gpt4 { background: #9b59b6; }
         
         /* Entity Styles */
-        .text-section {{
+        .text-section {
             margin: 30px 0;
             padding: 20px;
             border: 1px solid #ddd;
             border-radius: 8px;
-        }}
-        .source-section {{
+        }
+        .source-section {
             margin: 15px 0;
             padding: 15px;
             border-left: 4px solid #3498db;
             background: #f8f9fa;
-        }}
-        .source-title {{
+        }
+        .source-title {
             font-weight: bold;
             margin-bottom: 10px;
             color: #2c3e50;
-        }}
-        .text-content {{
+        }
+        .text-content {
             line-height: 2;
             font-size: 16px;
-        }}
+        }
         
-        .entity {{
+        .entity {
             cursor: help;
             display: inline-block;
             position: relative;
@@ -551,32 +309,32 @@ class EntityMarkupConverter:
             border-radius: 3px;
             padding: 2px 4px;
             margin: 1px;
-        }}
+        }
         
-        .entity:hover {{
+        .entity:hover {
             transform: translateY(-1px);
             box-shadow: 0 2px 8px rgba(0,0,0,0.2);
             z-index: 10;
-        }}
+        }
         
-        .entity.highlighted {{
+        .entity.highlighted {
             animation: pulse 1s ease-in-out;
             box-shadow: 0 0 10px rgba(52, 152, 219, 0.6);
-        }}
+        }
         
-        @keyframes pulse {{
-            0% {{ box-shadow: 0 0 0 0 rgba(52, 152, 219, 0.7); }}
-            70% {{ box-shadow: 0 0 0 10px rgba(52, 152, 219, 0); }}
-            100% {{ box-shadow: 0 0 0 0 rgba(52, 152, 219, 0); }}
-        }}
+        @keyframes pulse {
+            0% { box-shadow: 0 0 0 0 rgba(52, 152, 219, 0.7); }
+            70% { box-shadow: 0 0 0 10px rgba(52, 152, 219, 0); }
+            100% { box-shadow: 0 0 0 0 rgba(52, 152, 219, 0); }
+        }
         
         /* Multi-label entity styles */
-        .entity.multi-label {{
+        .entity.multi-label {
             position: relative;
             background: linear-gradient(45deg, var(--primary-color) 0%, var(--primary-color) 50%, var(--secondary-color) 50%, var(--secondary-color) 100%);
-        }}
+        }
         
-        .entity.multi-label::after {{
+        .entity.multi-label::after {
             content: attr(data-type-count);
             position: absolute;
             top: -8px;
@@ -591,9 +349,9 @@ class EntityMarkupConverter:
             align-items: center;
             justify-content: center;
             font-weight: bold;
-        }}
+        }
         
-        .entity.triple-label {{
+        .entity.triple-label {
             background: repeating-linear-gradient(
                 45deg,
                 var(--primary-color),
@@ -603,10 +361,10 @@ class EntityMarkupConverter:
                 var(--tertiary-color) 8px,
                 var(--tertiary-color) 12px
             );
-        }}
+        }
         
         /* Enhanced tooltip */
-        .entity-tooltip {{
+        .entity-tooltip {
             position: absolute;
             background: #2c3e50;
             color: white;
@@ -619,167 +377,167 @@ class EntityMarkupConverter:
             opacity: 0;
             pointer-events: none;
             transition: opacity 0.2s ease;
-        }}
+        }
         
-        .entity:hover .entity-tooltip {{
+        .entity:hover .entity-tooltip {
             opacity: 1;
-        }}
+        }
         
-        .tooltip-section {{
+        .tooltip-section {
             margin-bottom: 8px;
-        }}
+        }
         
-        .tooltip-section:last-child {{
+        .tooltip-section:last-child {
             margin-bottom: 0;
-        }}
+        }
         
-        .tooltip-label {{
+        .tooltip-label {
             font-weight: bold;
             color: #3498db;
-        }}
+        }
         
-        .type-list {{
+        .type-list {
             list-style: none;
             padding: 0;
             margin: 4px 0 0 0;
-        }}
+        }
         
-        .type-item {{
+        .type-item {
             padding: 2px 6px;
             margin: 2px 0;
             background: rgba(255,255,255,0.1);
             border-radius: 3px;
             font-size: 11px;
-        }}
+        }
         
-        .stats-table {{
+        .stats-table {
             width: 100%;
             border-collapse: collapse;
             margin: 20px 0;
-        }}
-        .stats-table th, .stats-table td {{
+        }
+        .stats-table th, .stats-table td {
             border: 1px solid #ddd;
             padding: 12px;
             text-align: left;
-        }}
-        .stats-table th {{
+        }
+        .stats-table th {
             background-color: #3498db;
             color: white;
-        }}
-        .stats-table tr:nth-child(even) {{
+        }
+        .stats-table tr:nth-child(even) {
             background-color: #f2f2f2;
-        }}
-        .summary {{
+        }
+        .summary {
             background: #e8f5e8;
             padding: 20px;
             border-radius: 8px;
             margin: 20px 0;
-        }}
+        }
         
-        .ground_truth {{ border-left: 4px solid #27ae60; }}
-        .mistral {{ border-left: 4px solid #e74c3c; }}
-        .gpt4 {{ border-left: 4px solid #9b59b6; }}
+        .ground_truth { border-left: 4px solid #27ae60; }
+        .mistral { border-left: 4px solid #e74c3c; }
+        .gpt4 { border-left: 4px solid #9b59b6; }
         
         /* Responsive design */
-        @media (max-width: 1400px) {{
-            body {{ padding-right: 20px; }}
-            .floating-legend {{
+        @media (max-width: 1400px) {
+            body { padding-right: 20px; }
+            .floating-legend {
                 position: relative;
                 top: auto;
                 right: auto;
                 width: 100%;
                 margin: 20px 0;
-            }}
-        }}
-        
-        @media (max-width: 768px) {{
-            .container {{ padding: 15px; }}
-            .floating-legend {{ width: 100%; }}
-            .legend-content {{ padding: 10px; }}
-        }}
+            }
+        }
+        
+        @media (max-width: 768px) {
+            .container { padding: 15px; }
+            .floating-legend { width: 100%; }
+            .legend-content { padding: 10px; }
+        }
     </style>
     <script>
-        document.addEventListener('DOMContentLoaded', function() {{
+        document.addEventListener('DOMContentLoaded', function() {
             // Toggle legend
             const toggleBtn = document.querySelector('.legend-toggle');
             const legendContent = document.querySelector('.legend-content');
             
-            toggleBtn.addEventListener('click', function() {{
+            toggleBtn.addEventListener('click', function() {
                 legendContent.classList.toggle('collapsed');
                 toggleBtn.textContent = legendContent.classList.contains('collapsed') ? '+' : '−';
-            }});
+            });
             
             // Entity type filtering
             const entityTypeItems = document.querySelectorAll('.legend-item[data-type]');
             const sourceItems = document.querySelectorAll('.source-legend-item[data-source]');
             
-            entityTypeItems.forEach(item => {{
-                item.addEventListener('click', function() {{
+            entityTypeItems.forEach(item => {
+                item.addEventListener('click', function() {
                     const type = this.dataset.type;
                     const isActive = this.classList.contains('active');
                     
                     // Clear all active states
                     entityTypeItems.forEach(i => i.classList.remove('active'));
                     
-                    if (!isActive) {{
+                    if (!isActive) {
                         this.classList.add('active');
                         highlightEntitiesByType(type);
-                    }} else {{
+                    } else {
                         clearHighlights();
-                    }}
-                }});
-            }});
+                    }
+                });
+            });
             
-            sourceItems.forEach(item => {{
-                item.addEventListener('click', function() {{
+            sourceItems.forEach(item => {
+                item.addEventListener('click', function() {
                     const source = this.dataset.source;
                     const isActive = this.classList.contains('active');
                     
                     // Clear all active states
                     sourceItems.forEach(i => i.classList.remove('active'));
                     
-                    if (!isActive) {{
+                    if (!isActive) {
                         this.classList.add('active');
                         highlightEntitiesBySource(source);
-                    }} else {{
+                    } else {
                         clearHighlights();
-                    }}
-                }});
-            }});
+                    }
+                });
+            });
             
-            function highlightEntitiesByType(type) {{
+            function highlightEntitiesByType(type) {
                 clearHighlights();
                 const entities = document.querySelectorAll('.entity');
-                entities.forEach(entity => {{
+                entities.forEach(entity => {
                     const entityTypes = entity.getAttribute('data-types');
-                    if (entityTypes && entityTypes.includes(type)) {{
+                    if (entityTypes && entityTypes.includes(type)) {
                         entity.classList.add('highlighted');
-                    }} else {{
+                    } else {
                         entity.style.opacity = '0.3';
-                    }}
-                }});
-            }}
+                    }
+                });
+            }
             
-            function highlightEntitiesBySource(source) {{
+            function highlightEntitiesBySource(source) {
                 clearHighlights();
                 const entities = document.querySelectorAll('.entity');
-                entities.forEach(entity => {{
-                    if (entity.classList.contains(source)) {{
+                entities.forEach(entity => {
+                    if (entity.classList.contains(source)) {
                         entity.classList.add('highlighted');
-                    }} else {{
+                    } else {
                         entity.style.opacity = '0.3';
-                    }}
-                }});
-            }}
+                    }
+                });
+            }
             
-            function clearHighlights() {{
+            function clearHighlights() {
                 const entities = document.querySelectorAll('.entity');
-                entities.forEach(entity => {{
+                entities.forEach(entity => {
                     entity.classList.remove('highlighted');
                     entity.style.opacity = '';
-                }});
-            }}
-        }});
+                });
+            }
+        });
     </script>
 </head>
 <body>
@@ -790,164 +548,30 @@ class EntityMarkupConverter:
         <div class="legend">
             <h3>Entity Type Legend</h3>
 """
-        
-        # Create floating legend
-        html_content += """
-        <!-- Floating Legend -->
-        <div class="floating-legend">
-            <div class="legend-header">
-                <span>Entity Legend</span>
-                <button class="legend-toggle">−</button>
-            </div>
-            <div class="legend-content">
-                <div class="legend-section">
-                    <div class="legend-section-title">Entity Types</div>
-"""
-        
-        # Add entity type legend items
-        for entity_type, color in self.entity_colors.items():
-            if entity_type != 'default':
-                html_content += f'''
-                    <div class="legend-item" data-type="{entity_type}">
-                        <div class="legend-color" style="background-color: {color};"></div>
-                        <div class="legend-text">{entity_type}</div>
-                    </div>'''
-        
-        html_content += """
-                </div>
-                <div class="legend-section">
-                    <div class="legend-section-title">Sources</div>
-                    <div class="source-legend-item" data-source="ground_truth">
-                        <div class="source-indicator ground_truth"></div>
-                        <div class="legend-text">Ground Truth</div>
-                    </div>
-                    <div class="source-legend-item" data-source="mistral">
-                        <div class="source-indicator mistral"></div>
-                        <div class="legend-text">Mistral Small 3.2</div>
-                    </div>
-                    <div class="source-legend-item" data-source="gpt4">
-                        <div class="source-indicator gpt4"></div>
-                        <div class="legend-text">GPT-4o Mini</div>
-                    </div>
-                </div>
-                <div class="legend-section">
-                    <div class="legend-section-title">Multi-Label</div>
-                    <div class="legend-item">
-                        <div class="legend-color multi-type" style="--color1: #FF6B6B; --color2: #4ECDC4;"></div>
-                        <div class="legend-text">Multiple Types</div>
-                    </div>
-                </div>
-            </div>
-        </div>
-"""
-        
-        # Process JSONL file
-        total_comparisons = {'mistral': ComparisonResult(), 'gpt4': ComparisonResult()}
-        text_count = 0
-        
-        with open(jsonl_file, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                if not line.strip():
-                    continue
-                
-                try:
-                    item = json.loads(line)
-                    text_count += 1
-                    
-                    # Extract entities
-                    all_entities = self.extract_entities(item)
-                    ground_truth = [e for e in all_entities if e.source == 'ground_truth']
-                    mistral_entities = [e for e in all_entities if e.source == 'mistral']
-                    gpt4_entities = [e for e in all_entities if e.source == 'gpt4']
-                    
-                    # Add to HTML
-                    html_content += f"""
+
+# One text passage with the three marked-up versions of its text
+_PASSAGE_TMPL = """
         <div class="text-section">
             <h3>Text Passage {text_count}</h3>
             
             <div class="source-section ground_truth">
-                <div class="source-title">Ground Truth ({len(ground_truth)} entities)</div>
-                <div class="text-content">{self.markup_text(item['text'], ground_truth)}</div>
+                <div class="source-title">Ground Truth ({gt_len} entities)</div>
+                <div class="text-content">{gt_marked}</div>
             </div>
             
             <div class="source-section mistral">
-                <div class="source-title">Mistral Small 3.2 ({len(mistral_entities)} entities)</div>
-                <div class="text-content">{self.markup_text(item['text'], mistral_entities)}</div>
+                <div class="source-title">Mistral Small 3.2 ({mistral_len} entities)</div>
+                <div class="text-content">{mistral_marked}</div>
             </div>
             
             <div class="source-section gpt4">
-                <div class="source-title">GPT-4o Mini ({len(gpt4_entities)} entities)</div>
-                <div class="text-content">{self.markup_text(item['text'], gpt4_entities)}</div>
+                <div class="source-title">GPT-4o Mini ({gpt4_len} entities)</div>
+                <div class="text-content">{gpt4_marked}</div>
             </div>
 """
-                    
-                    # Compare annotations
-                    mistral_comparison = self.compare_annotations(ground_truth, mistral_entities)
-                    gpt4_comparison = self.compare_annotations(ground_truth, gpt4_entities)
-                    
-                    # Add comparison stats
-#                     html_content += f"""
-#             <table class="stats-table">
-#                 <tr>
-#                     <th>Metric</th>
-#                     <th>Mistral Small 3.2</th>
-#                     <th>GPT-4o Mini</th>
-#                 </tr>
-#                 <tr>
-#                     <td>Exact Matches</td>
-#                     <td>{mistral_comparison.exact_matches}</td>
-#                     <td>{gpt4_comparison.exact_matches}</td>
-#                 </tr>
-#                 <tr>
-#                     <td>Partial Matches</td>
-#                     <td>{mistral_comparison.partial_matches}</td>
-#                     <td>{gpt4_comparison.partial_matches}</td>
-#                 </tr>
-#                 <tr>
-#                     <td>Model Only</td>
-#                     <td>{mistral_comparison.model_only}</td>
-#                     <td>{gpt4_comparison.model_only}</td>
-#                 </tr>
-#                 <tr>
-#                     <td>Ground Truth Only</td>
-#                     <td>{mistral_comparison.ground_truth_only}</td>
-#                     <td>{gpt4_comparison.ground_truth_only}</td>
-#                 </tr>
-#                 <tr>
-#                     <td>Precision</td>
-#                     <td>{mistral_comparison.exact_matches / max(mistral_comparison.total_model, 1):.2%}</td>
-#                     <td>{gpt4_comparison.exact_matches / max(gpt4_comparison.total_model, 1):.2%}</td>
-#                 </tr>
-#                 <tr>
-#                     <td>Recall</td>
-#                     <td>{mistral_comparison.exact_matches / max(mistral_comparison.total_ground_truth, 1):.2%}</td>
-#                     <td>{gpt4_comparison.exact_matches / max(gpt4_comparison.total_ground_truth, 1):.2%}</td>
-#                 </tr>
-#             </table>
-#         </div>
-# """
-                    html_content += """
-         </div>
-"""
-                    
-                    # Accumulate totals
-                    for attr in ['exact_matches', 'partial_matches', 'ground_truth_only', 
-                               'model_only', 'total_ground_truth', 'total_model']:
-                        setattr(total_comparisons['mistral'], attr, 
-                               getattr(total_comparisons['mistral'], attr) + getattr(mistral_comparison, attr))
-                        setattr(total_comparisons['gpt4'], attr,
-                               getattr(total_comparisons['gpt4'], attr) + getattr(gpt4_comparison, attr))
-                
-                except json.JSONDecodeError as e:
-                    html_content += f'<p style="color: red;">Error parsing line {line_num}: {e}</p>\n'
-                except Exception as e:
-                    html_content += f'<p style="color: red;">Error processing line {line_num}: {e}</p>\n'
-        
-        # Add overall summary
-        mistral_total = total_comparisons['mistral']
-        gpt4_total = total_comparisons['gpt4']
-        
-        html_content += f"""
+
+# Overall comparison table at the end of the report
+_SUMMARY_TMPL = """
         <div class="summary">
             <h2>Overall Summary</h2>
             <p>Processed {text_count} text passages</p>
@@ -960,36 +584,39 @@ class EntityMarkupConverter:
                 </tr>
                 <tr>
                     <td>Total Entities Predicted</td>
-                    <td>{mistral_total.total_model}</td>
-                    <td>{gpt4_total.total_model}</td>
+                    <td>{mistral_total_model}</td>
+                    <td>{gpt4_total_model}</td>
                 </tr>
                 <tr>
                     <td>Total Ground Truth Entities</td>
-                    <td colspan="2">{mistral_total.total_ground_truth}</td>
+                    <td colspan="2">{total_ground_truth}</td>
                 </tr>
                 <tr>
                     <td>Exact Matches</td>
-                    <td>{mistral_total.exact_matches}</td>
-                    <td>{gpt4_total.exact_matches}</td>
+                    <td>{mistral_exact}</td>
+                    <td>{gpt4_exact}</td>
                 </tr>
                 <tr>
                     <td>Overall Precision</td>
-                    <td>{mistral_total.exact_matches / max(mistral_total.total_model, 1):.2%}</td>
-                    <td>{gpt4_total.exact_matches / max(gpt4_total.total_model, 1):.2%}</td>
+                    <td>{mistral_precision:.2%}</td>
+                    <td>{gpt4_precision:.2%}</td>
                 </tr>
                 <tr>
                     <td>Overall Recall</td>
-                    <td>{mistral_total.exact_matches / max(mistral_total.total_ground_truth, 1):.2%}</td>
-                    <td>{gpt4_total.exact_matches / max(gpt4_total.total_ground_truth, 1):.2%}</td>
+                    <td>{mistral_recall:.2%}</td>
+                    <td>{gpt4_recall:.2%}</td>
                 </tr>
                 <tr>
                     <td>F1 Score</td>
-                    <td>{2 * (mistral_total.exact_matches / max(mistral_total.total_model, 1)) * (mistral_total.exact_matches / max(mistral_total.total_ground_truth, 1)) / max((mistral_total.exact_matches / max(mistral_total.total_model, 1)) + (mistral_total.exact_matches / max(mistral_total.total_ground_truth, 1)), 0.001):.2%}</td>
-                    <td>{2 * (gpt4_total.exact_matches / max(gpt4_total.total_model, 1)) * (gpt4_total.exact_matches / max(gpt4_total.total_ground_truth, 1)) / max((gpt4_total.exact_matches / max(gpt4_total.total_model, 1)) + (gpt4_total.exact_matches / max(gpt4_total.total_ground_truth, 1)), 0.001):.2%}</td>
+                    <td>{mistral_f1:.2%}</td>
+                    <td>{gpt4_f1:.2%}</td>
                 </tr>
             </table>
         </div>
-        
+"""
+
+# Static end of the report: reading guide and closing tags
+_HTML_FOOTER = """        
         <div style="margin-top: 40px; padding: 20px; background: #f8f9fa; border-radius: 8px;">
             <h3>How to Read This Report</h3>
             <ul>
@@ -1006,37 +633,852 @@ class EntityMarkupConverter:
 </body>
 </html>
 """
+
+# Renders passages embedded by EntityMarkupConverter.passage_data into the same
+# HTML as markup_text, with the same character escapes. Offsets are code
+# points, hence Array.from(text).
+_CLIENT_RENDER_SCRIPT = """
+        <script>
+            document.addEventListener('DOMContentLoaded', function() {
+                const tags = JSON.parse(document.getElementById('entity-tags').textContent);
+                const escapes = %s;
+                const escapeHtml = s => s.replace(/[&<>"']/g, c => escapes[c]);
+                
+                document.querySelectorAll('script.passage-data').forEach(script => {
+                    const data = JSON.parse(script.textContent);
+                    const chars = Array.from(data.text);
+                    const slice = (start, end) => escapeHtml(chars.slice(start, end).join(''));
+                    const section = script.closest('.text-section');
+                    
+                    for (const [source, groups] of Object.entries(data.spans)) {
+                        const target = section.querySelector('.source-section.' + source + ' .text-content');
+                        const parts = [];
+                        let lastPos = 0;
+                        for (const [groupStart, groupEnd, start, end, tagKey, occurrence] of groups) {
+                            const [openTag, tooltipHead, tooltipTail] = tags[tagKey];
+                            parts.push(slice(lastPos, groupStart), openTag, slice(start, end),
+                                       occurrence > 1 ? '<sup>' + occurrence + '</sup>' : '',
+                                       tooltipHead, start + '-' + end, tooltipTail);
+                            lastPos = groupEnd;
+                        }
+                        parts.push(slice(lastPos, chars.length));
+                        target.innerHTML = parts.join('');
+                    }
+                });
+            });
+        </script>
+""" % json.dumps({char: _escape_chars(char) for char in '&<>"\''})
+
+# Lines per worker task, and tasks kept in flight per worker
+_MAP_CHUNK_SIZE = 32
+_MAP_CHUNKS_PER_WORKER = 4
+
+# Output buffer for the report file; reports often run to several megabytes
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Status of a processed JSONL line, see EntityMarkupConverter.process_line
+_OK = 'ok'
+_PARSE_ERROR = 'parse_error'
+_PROCESS_ERROR = 'process_error'
+
+# Markup for a single highlighted entity. Everything except the span text,
+# occurrence number and position depends only on the source and types, so
+# create_entity_html formats these pieces once per combination and caches them.
+_ENTITY_OPEN_TMPL = (
+    '<span class="entity {source} {multi_label_class}" '
+    'style="{background_style} {css_variables} opacity: {opacity}; '
+    'border: 1px solid {primary_color};" '
+    'data-types="{types}" {type_count_attr}>'
+)
+
+_TOOLTIP_HEAD_TMPL = '''
+        <div class="entity-tooltip">
+            <div class="tooltip-section">
+                <span class="tooltip-label">Source:</span> {source_label}
+            </div>
+            <div class="tooltip-section">
+                <span class="tooltip-label">Position:</span> '''
+
+_TOOLTIP_TAIL_TMPL = '''
+            </div>
+            <div class="tooltip-section">
+                <span class="tooltip-label">Types:</span>
+                <ul class="type-list">
+        {type_items}
+                </ul>
+            </div>
+        </div>
+        </span>'''
+
+
+@dataclass(slots=True, frozen=True)
+class EntitySpan:
+    """Represents an entity span with its position and metadata."""
+    start: int
+    end: int
+    text: str
+    types: List[str]
+    source: str  # 'ground_truth', 'mistral', 'gpt4'
+    occurrence_id: int = 0  # For tracking repeated spans
+    _key: Tuple = field(init=False, repr=False, compare=False)  # (start, end, sorted types)
+    _pos: Tuple[int, int] = field(init=False, repr=False, compare=False)
+    _sk: Tuple[int, int] = field(init=False, repr=False, compare=False)  # sort key (start, -end)
+
+    def __post_init__(self):
+        # Comparison and sort keys are fixed per span, so build them once
+        object.__setattr__(self, '_key', (self.start, self.end, tuple(sorted(self.types))))
+        object.__setattr__(self, '_pos', (self.start, self.end))
+        object.__setattr__(self, '_sk', (self.start, -self.end))
+
+
+@dataclass(slots=True)
+class ComparisonResult:
+    """Results of comparing entity annotations."""
+    exact_matches: int = 0
+    partial_matches: int = 0
+    type_mismatches: int = 0
+    ground_truth_only: int = 0
+    model_only: int = 0
+    total_ground_truth: int = 0
+    total_model: int = 0
+
+    def __iadd__(self, other: 'ComparisonResult') -> 'ComparisonResult':
+        """Add another result's counts to this one, e.g. to accumulate totals."""
+        self.exact_matches += other.exact_matches
+        self.partial_matches += other.partial_matches
+        self.type_mismatches += other.type_mismatches
+        self.ground_truth_only += other.ground_truth_only
+        self.model_only += other.model_only
+        self.total_ground_truth += other.total_ground_truth
+        self.total_model += other.total_model
+        return self
+
+
+class EntityMarkupConverter:
+    """Converts JSONL entity data to HTML markup."""
+    
+    def __init__(self, max_workers: Optional[int] = None, summary_only: bool = False,
+                 client_render: bool = False):
+        # Worker processes for rendering passages; None uses every CPU, 1 runs in-process
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        elif max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        self.max_workers = max_workers
+        # Skip the marked-up passages and report only the overall summary
+        self.summary_only = summary_only
+        # Ship each passage text once as JSON and highlight it in the browser
+        self.client_render = client_render
         
-        return html_content
+        self.entity_colors = {
+            'E21 Person': '#FF6B6B',
+            'E53 Place': '#4ECDC4', 
+            'E52 Time-Span': '#45B7D1',
+            'E54 Dimension': '#96CEB4',
+            'E19 Physical Thing': '#FFEAA7',
+            'E74 Group': '#DDA0DD',
+            'E86 Leaving': '#F39C12',
+            'E9 Move': '#E17055',
+            'F2 Expression': '#A29BFE',
+            'E31 Document': '#FD79A8',
+            'E55 Type': '#FDCB6E',
+            'E7 Activity': '#6C5CE7',
+            'default': '#BDC3C7'
+        }
+        
+        self._default_color = self.entity_colors['default']
+        
+        self.source_labels = {
+            'ground_truth': 'Ground Truth',
+            'mistral': 'Mistral Small 3.2',
+            'gpt4': 'GPT-4o Mini'
+        }
+        
+        self._init_lru_caches()
+        
+        # Per-type and per-type-combination markup, built once and reused
+        self._combined_cache: Dict[Tuple[str, ...], Tuple[str, str]] = {}
+        self._multi_label_meta: Dict[Tuple[str, ...], Tuple[str, str, str, str]] = {}
+        self._entity_tag_cache: Dict[Tuple[str, Tuple[str, ...], bool], Tuple[str, str, str]] = {}
+        self._type_li_cache: Dict[str, str] = {
+            entity_type: f'<li class="type-item" style="border-left: 3px solid {color};">{entity_type}</li>'
+            for entity_type, color in self.entity_colors.items()
+        }
+        self._legend_html = ''.join(
+            f'''
+                    <div class="legend-item" data-type="{entity_type}">
+                        <div class="legend-color" style="background-color: {color};"></div>
+                        <div class="legend-text">{entity_type}</div>
+                    </div>'''
+            for entity_type, color in self.entity_colors.items()
+            if entity_type != 'default'
+        )
 
-    def convert_file(self, input_file: str, output_file: str):
-        """Convert JSONL file to HTML report."""
-        print(f"Converting {input_file} to {output_file}...")
+    def _init_lru_caches(self):
+        """Set up the LRU-cached helpers (not picklable, so rebuilt in worker processes)."""
+        # Span texts repeat across occurrences and sources
+        self._escape = lru_cache(maxsize=4096)(_escape_text)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_escape']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_lru_caches()
+
+    def find_all_occurrences(self, text: str, span_text: str) -> List[Tuple[int, int]]:
+        """Find all non-overlapping occurrences of a span in the text."""
+        if not span_text:
+            return []
+        
+        occurrences = []
+        span_len = len(span_text)
+        start = 0
+        while True:
+            pos = text.find(span_text, start)
+            if pos == -1:
+                break
+            occurrences.append((pos, pos + span_len))
+            start = pos + span_len
+        return occurrences
+
+    def find_span_occurrences(self, text: str, spans: Set[str]) -> Dict[str, List[Tuple[int, int]]]:
+        """Find all occurrences of several spans, scanning once per distinct span.
+
+        Uses a single Aho-Corasick pass when pyahocorasick is installed.
+        """
+        if ahocorasick is None:
+            return {span_text: self.find_all_occurrences(text, span_text) for span_text in spans}
+        
+        automaton = ahocorasick.Automaton()
+        for span_text in spans:
+            if span_text:
+                automaton.add_word(span_text, span_text)
+        
+        occurrences = {span_text: [] for span_text in spans}
+        if len(automaton) == 0:
+            return occurrences
+        
+        # Hits of one span arrive in increasing position order; skip any hit
+        # that overlaps the previous one, as find_all_occurrences does
+        automaton.make_automaton()
+        for end_index, span_text in automaton.iter(text):
+            start = end_index - len(span_text) + 1
+            positions = occurrences[span_text]
+            if not positions or start >= positions[-1][1]:
+                positions.append((start, end_index + 1))
+        return occurrences
+
+    def extract_entities(self, item: Dict) -> Dict[str, List[EntitySpan]]:
+        """Extract all entity spans from a JSONL item, bucketed by source."""
+        text = item['text']
+        entities_by_source = {}
+        
+        sources = [('labels', 'ground_truth'),
+                   ('mistral_small_3.2_output', 'mistral'),
+                   ('gpt_4o_mini_output', 'gpt4')]
+        
+        # Look up each distinct span once, however many sources mention it
+        spans = {record['span'] for key, _ in sources for record in item.get(key, [])}
+        occurrences = self.find_span_occurrences(text, spans)
+        
+        for key, source_name in sources:
+            entities = entities_by_source[source_name] = []
+            # Track occurrences of each span text, per source
+            span_counters = defaultdict(int)
+            
+            for record in item.get(key, []):
+                span_text = record['span']
+                types = record['types']
+                for start, end in occurrences[span_text]:
+                    span_counters[span_text] += 1
+                    entities.append(EntitySpan(
+                        start=start,
+                        end=end,
+                        text=span_text,
+                        types=types,
+                        source=source_name,
+                        occurrence_id=span_counters[span_text]
+                    ))
+            
+            entities.sort(key=attrgetter('_sk'))
+        
+        return entities_by_source
+
+    def resolve_overlaps(self, entities: List[EntitySpan]) -> List[List[EntitySpan]]:
+        """Group overlapping entities together."""
+        return self._group_overlaps(entities)[0]
+
+    def _group_overlaps(self, entities: List[EntitySpan]) -> Tuple[List[List[EntitySpan]], List[int]]:
+        """Group overlapping entities and return the groups with the end offset of each group."""
+        if not entities:
+            return [], []
+        
+        if len(entities) >= _NUMBA_MIN_ENTITIES and _load_group_overlaps_nb() is not None:
+            return self._group_overlaps_jit(entities)
+        
+        groups = []
+        group_ends = []
+        current_group = [entities[0]]
+        group_max_end = entities[0].end
+        
+        # Entities are sorted by start, so an entity overlaps the current
+        # group exactly when it starts before the group's furthest end
+        for entity in entities[1:]:
+            if entity.start < group_max_end:
+                current_group.append(entity)
+                if entity.end > group_max_end:
+                    group_max_end = entity.end
+            else:
+                groups.append(current_group)
+                group_ends.append(group_max_end)
+                current_group = [entity]
+                group_max_end = entity.end
+        
+        groups.append(current_group)
+        group_ends.append(group_max_end)
+        return groups, group_ends
+
+    def _group_overlaps_jit(self, entities: List[EntitySpan]) -> Tuple[List[List[EntitySpan]], List[int]]:
+        """Group overlapping entities using the compiled sweep over span offsets."""
+        starts = np.fromiter((e.start for e in entities), dtype=np.int32, count=len(entities))
+        ends = np.fromiter((e.end for e in entities), dtype=np.int32, count=len(entities))
+        group_ids, group_ends = _group_overlaps_nb(starts, ends)
+        
+        # Group ids are non-decreasing, so each group is a contiguous run
+        boundaries = np.flatnonzero(np.diff(group_ids)) + 1
+        run_starts = [0, *boundaries.tolist()]
+        run_ends = [*boundaries.tolist(), len(entities)]
+        return [entities[s:e] for s, e in zip(run_starts, run_ends)], group_ends.tolist()
+
+    def get_primary_color(self, types: List[str]) -> str:
+        """Get the primary color for an entity based on its types."""
+        colors = self.entity_colors
+        return next((c for t in types if (c := colors.get(t))), self._default_color)
+
+    def _known_colors(self, types: List[str]) -> List[str]:
+        """Get the colors of the types that have one, in order."""
+        colors = self.entity_colors
+        return [c for t in types if (c := colors.get(t))]
+    
+    def get_combined_colors(self, types: List[str]) -> Tuple[str, str]:
+        """Get combined colors for multi-label entities."""
+        key = tuple(types)
+        combined = self._combined_cache.get(key)
+        if combined is None:
+            combined = self._combined_cache[key] = self._build_combined_colors(types)
+        return combined
+
+    def _build_combined_colors(self, types: List[str]) -> Tuple[str, str]:
+        """Compute the primary color and background for a type combination."""
+        if len(types) <= 1:
+            primary = self.get_primary_color(types)
+            return primary, primary
+        
+        # Get colors for all types
+        colors = self._known_colors(types)
+        
+        if not colors:
+            return self._default_color, self._default_color
+        
+        if len(colors) == 1:
+            return colors[0], colors[0]
+        
+        # For multiple colors, create a gradient or pattern
+        primary_color = colors[0]
+        
+        # Create a CSS gradient background for multiple types
+        if len(colors) == 2:
+            gradient = f"linear-gradient(45deg, {colors[0]} 50%, {colors[1]} 50%)"
+        else:
+            # For 3+ colors, create stripes
+            stripe_width = 100 // len(colors)
+            gradient_stops = []
+            for i, color in enumerate(colors):
+                start = i * stripe_width
+                end = (i + 1) * stripe_width
+                gradient_stops.append(f"{color} {start}%, {color} {end}%")
+            gradient = f"linear-gradient(45deg, {', '.join(gradient_stops)})"
+        
+        return primary_color, gradient
+
+    def format_types(self, types: List[str]) -> str:
+        """Format entity types for display."""
+        return ', '.join(types)
+
+    def _get_type_li(self, entity_type: str) -> str:
+        """Get the tooltip list item for an entity type."""
+        li = self._type_li_cache.get(entity_type)
+        if li is None:
+            color = self._default_color
+            li = self._type_li_cache[entity_type] = (
+                f'<li class="type-item" style="border-left: 3px solid {color};">{entity_type}</li>'
+            )
+        return li
+
+    def _get_multi_label_meta(self, types: List[str]) -> Tuple[str, str, str, str]:
+        """Get the class, CSS variables, type count and background style for a type combination."""
+        key = tuple(types)
+        meta = self._multi_label_meta.get(key)
+        if meta is not None:
+            return meta
+        
+        _, background = self.get_combined_colors(types)
+        multi_label_class = ""
+        css_variables = ""
+        type_count_attr = ""
+        
+        if len(types) > 1:
+            multi_label_class = "multi-label"
+            type_count_attr = f'data-type-count="{len(types)}"'
+            
+            # Get colors for CSS variables
+            colors = self._known_colors(types)
+            
+            if len(colors) >= 2:
+                css_variables = f"--primary-color: {colors[0]}; --secondary-color: {colors[1]};"
+                if len(colors) >= 3:
+                    multi_label_class = "triple-label"
+                    css_variables += f" --tertiary-color: {colors[2]};"
+        
+        # Use gradient background for multi-type entities, solid color for single type
+        if len(types) > 1:
+            background_style = f"background: {background};"
+        else:
+            background_style = f"background-color: {background};"
+        
+        meta = self._multi_label_meta[key] = (
+            multi_label_class, css_variables, type_count_attr, background_style
+        )
+        return meta
+
+    def create_entity_html(self, entity: EntitySpan, is_primary: bool = True) -> str:
+        """Create HTML markup for a single entity with sophisticated multi-label support."""
+        open_tag, tooltip_head, tooltip_tail = self._get_entity_tags(
+            entity.source, entity.types, is_primary
+        )
+        
+        # Create occurrence indicator if needed
+        occurrence_suffix = f"<sup>{entity.occurrence_id}</sup>" if entity.occurrence_id > 1 else ""
+        
+        return (
+            f'{open_tag}{self._escape(entity.text)}{occurrence_suffix}'
+            f'{tooltip_head}{entity.start}-{entity.end}{tooltip_tail}'
+        )
+
+    def _get_entity_tags(self, source: str, types: List[str], is_primary: bool = True) -> Tuple[str, str, str]:
+        """Get the opening tag and tooltip pieces shared by all entities with this source and types."""
+        key = (source, tuple(types), is_primary)
+        tags = self._entity_tag_cache.get(key)
+        if tags is None:
+            tags = self._entity_tag_cache[key] = self._build_entity_tags(source, types, is_primary)
+        return tags
+
+    def _build_entity_tags(self, source: str, types: List[str], is_primary: bool) -> Tuple[str, str, str]:
+        """Format the opening tag and tooltip pieces for a source and type combination."""
+        primary_color, _ = self.get_combined_colors(types)
+        opacity = '0.8' if is_primary else '0.4'
+        
+        # Determine multi-label class and styling
+        multi_label_class, css_variables, type_count_attr, background_style = \
+            self._get_multi_label_meta(types)
+        
+        open_tag = _ENTITY_OPEN_TMPL.format(
+            source=source,
+            multi_label_class=multi_label_class,
+            background_style=background_style,
+            css_variables=css_variables,
+            opacity=opacity,
+            primary_color=primary_color,
+            types='|'.join(types),
+            type_count_attr=type_count_attr,
+        )
+        tooltip_head = _TOOLTIP_HEAD_TMPL.format(source_label=self.source_labels[source])
+        tooltip_tail = _TOOLTIP_TAIL_TMPL.format(
+            type_items=''.join(self._get_type_li(t) for t in types)
+        )
+        return open_tag, tooltip_head, tooltip_tail
+
+    def markup_text(self, text: str, entities: List[EntitySpan]) -> str:
+        """Create HTML markup for text with entity highlighting."""
+        return self._markup(text, entities, lambda start, end: _escape_text(text[start:end]))
+
+    def markup_text_multi(self, text: str, entity_lists: List[List[EntitySpan]]) -> Tuple[str, ...]:
+        """Create HTML markup for the same text once per entity list, escaping the text only once."""
+        escaped_range = self._escaped_ranges(text)
+        return tuple(self._markup(text, entities, escaped_range) for entities in entity_lists)
+
+    def _escaped_ranges(self, text: str) -> Callable[[int, int], str]:
+        """Escape the whole text once and return a lookup of escaped slices by raw offsets."""
+        escaped = _escape_text(text)
+        if escaped is text:
+            return lambda start, end: text[start:end]
+        
+        # Each special character grows the escaped text by a fixed amount;
+        # shifts[k] is the growth caused by the first k special characters
+        specials = []
+        shifts = [0]
+        shift = 0
+        for match in _SPECIAL_CHARS_RE.finditer(text):
+            specials.append(match.start())
+            shift += _ESCAPE_GROWTH[match.group()]
+            shifts.append(shift)
+        
+        def escaped_range(start: int, end: int) -> str:
+            return escaped[start + shifts[bisect_left(specials, start)]:
+                           end + shifts[bisect_left(specials, end)]]
+        return escaped_range
+
+    def _iter_groups(self, entities: List[EntitySpan]) -> Iterator[Tuple[int, int, EntitySpan]]:
+        """Yield (start, end, primary entity) for each group of overlapping entities."""
+        overlap_groups, group_ends = self._group_overlaps(entities)
+        for group, group_end in zip(overlap_groups, group_ends):
+            # Groups are sorted by start; use the longest span as primary
+            primary = group[0] if len(group) == 1 else max(group, key=lambda x: x.end - x.start)
+            yield group[0].start, group_end, primary
+
+    def passage_data(self, text: str, entities_by_source: Dict[str, List[EntitySpan]]
+                     ) -> Tuple[str, Dict[str, Tuple[str, List[str]]]]:
+        """Encode a passage for rendering in the browser instead of as marked-up HTML.
+        
+        Returns the passage as JSON (the text once, plus per source one
+        ``[group start, group end, entity start, entity end, tag key, occurrence]``
+        record per entity group) and the source and types behind each tag key.
+        """
+        spans = {}
+        tag_specs = {}
+        for source, entities in entities_by_source.items():
+            records = spans[source] = []
+            for group_start, group_end, primary in self._iter_groups(entities):
+                # JSON-encoded so type lists such as ['A|B'] and ['A', 'B'] stay distinct
+                tag_key = json.dumps([primary.source, primary.types], ensure_ascii=False)
+                tag_specs[tag_key] = (primary.source, primary.types)
+                records.append([group_start, group_end, primary.start, primary.end,
+                                tag_key, primary.occurrence_id])
+        
+        # Escape every '<' so neither '</script>' nor '<!--' can end or
+        # re-enter the script element early
+        passage_json = json.dumps({'text': text, 'spans': spans}, ensure_ascii=False).replace('<', '\\u003c')
+        return passage_json, tag_specs
+
+    def _markup(self, text: str, entities: List[EntitySpan],
+                escaped_range: Callable[[int, int], str]) -> str:
+        """Create HTML markup for text, taking escaped plain-text runs from ``escaped_range``."""
+        if not entities:
+            return escaped_range(0, len(text))
+        
+        result = []
+        last_pos = 0
+        
+        for group_start, group_end, primary in self._iter_groups(entities):
+            # Add text before this group
+            if group_start > last_pos:
+                result.append(escaped_range(last_pos, group_start))
+            
+            # Overlapping entities are shown as their longest span
+            result.append(self.create_entity_html(primary))
+            
+            last_pos = group_end
+        
+        # Add remaining text
+        if last_pos < len(text):
+            result.append(escaped_range(last_pos, len(text)))
+        
+        return ''.join(result)
+
+    def compare_annotations(self, ground_truth: List[EntitySpan], 
+                          model_entities: List[EntitySpan]) -> ComparisonResult:
+        """Compare model annotations with ground truth."""
+        result = ComparisonResult()
+        
+        # Convert to sets for comparison
+        gt_spans = {e._key for e in ground_truth}
+        model_spans = {e._key for e in model_entities}
+        exact_spans = gt_spans & model_spans
+        
+        result.total_ground_truth = len(gt_spans)
+        result.total_model = len(model_spans)
+        result.exact_matches = len(exact_spans)
+        result.ground_truth_only = len(gt_spans - model_spans)
+        result.model_only = len(model_spans - gt_spans)
         
+        # Check for partial matches (same span, different types)
+        gt_positions = {e._pos for e in ground_truth}
+        model_positions = {e._pos for e in model_entities}
+        
+        overlapping_positions = gt_positions & model_positions
+        exact_match_positions = {(s, e) for s, e, _ in exact_spans}
+        
+        result.partial_matches = len(overlapping_positions - exact_match_positions)
+        
+        return result
+
+    def process_line(self, line: bytes) -> Tuple[str, object]:
+        """Parse one JSONL line and render its three marked-up texts and comparisons.
+        
+        Returns a ``(status, payload)`` pair; on errors the payload is the message.
+        """
         try:
-            html_content = self.generate_html_report(input_file)
+            item = _json_loads(line)
+        except ValueError as e:  # JSONDecodeError of json, orjson and ujson
+            return _PARSE_ERROR, str(e)
+        
+        try:
+            # Extract entities
+            entities_by_source = self.extract_entities(item)
+            ground_truth = entities_by_source['ground_truth']
+            mistral_entities = entities_by_source['mistral']
+            gpt4_entities = entities_by_source['gpt4']
+            
+            # Compare annotations
+            mistral_comparison = self.compare_annotations(ground_truth, mistral_entities)
+            gpt4_comparison = self.compare_annotations(ground_truth, gpt4_entities)
+            
+            client_data = None
+            if self.summary_only:
+                gt_html = mistral_html = gpt4_html = None
+            elif self.client_render:
+                gt_html = mistral_html = gpt4_html = ''
+                client_data = self.passage_data(item['text'], entities_by_source)
+            else:
+                gt_html, mistral_html, gpt4_html = self.markup_text_multi(
+                    item['text'], [ground_truth, mistral_entities, gpt4_entities]
+                )
+            return _OK, (
+                len(ground_truth), gt_html,
+                len(mistral_entities), mistral_html,
+                len(gpt4_entities), gpt4_html,
+                client_data, mistral_comparison, gpt4_comparison,
+            )
+        except Exception as e:
+            return _PROCESS_ERROR, str(e)
+
+    def _map_lines(self, lines: List[bytes]) -> Iterator[Tuple[str, object]]:
+        """Run process_line over all lines, in order, using worker processes when configured."""
+        if self.max_workers == 1 or len(lines) < 2:
+            yield from map(self.process_line, lines)
+            return
+        
+        # Submit in a bounded window so finished passages don't pile up
+        # ahead of the writer
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = deque()
+            for start in range(0, len(lines), _MAP_CHUNK_SIZE):
+                pending.append(executor.submit(self._process_lines, lines[start:start + _MAP_CHUNK_SIZE]))
+                if len(pending) >= _MAP_CHUNKS_PER_WORKER * self.max_workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    def _process_lines(self, lines: List[bytes]) -> List[Tuple[str, object]]:
+        """Run process_line over a chunk of lines (one worker task)."""
+        return [self.process_line(line) for line in lines]
+
+    def generate_html_report(self, jsonl_file: str, out: Optional[TextIO] = None) -> Optional[str]:
+        """Generate complete HTML report from JSONL file.
+        
+        Writes to ``out`` when given; otherwise the report is returned as a string.
+        """
+        chunks = self.iter_html_report(jsonl_file)
+        if out is None:
+            return ''.join(chunks)
+        out.writelines(chunks)
+
+    def iter_html_report(self, jsonl_file: str) -> Iterator[str]:
+        """Return an iterator over the HTML report for a JSONL file, chunk by chunk.
+        
+        The input is read here, so an unreadable file raises before any output is produced.
+        """
+        # Read raw bytes in one go; orjson, ujson and json all parse UTF-8 bytes directly
+        with open(jsonl_file, 'rb') as f:
+            data = f.read()
+        numbered_lines = [(line_num, line) for line_num, line in enumerate(data.split(b'\n'), 1)
+                          if line.strip()]
+        return self._iter_report(numbered_lines)
+
+    def _iter_report(self, numbered_lines: List[Tuple[int, bytes]]) -> Iterator[str]:
+        """Yield the HTML report for numbered, non-blank JSONL lines."""
+        yield _HTML_PROLOGUE
+        
+        # Create floating legend
+        yield """
+        <!-- Floating Legend -->
+        <div class="floating-legend">
+            <div class="legend-header">
+                <span>Entity Legend</span>
+                <button class="legend-toggle">−</button>
+            </div>
+            <div class="legend-content">
+                <div class="legend-section">
+                    <div class="legend-section-title">Entity Types</div>
+"""
+        
+        # Add entity type legend items
+        yield self._legend_html
+        
+        yield """
+                </div>
+                <div class="legend-section">
+                    <div class="legend-section-title">Sources</div>
+                    <div class="source-legend-item" data-source="ground_truth">
+                        <div class="source-indicator ground_truth"></div>
+                        <div class="legend-text">Ground Truth</div>
+                    </div>
+                    <div class="source-legend-item" data-source="mistral">
+                        <div class="source-indicator mistral"></div>
+                        <div class="legend-text">Mistral Small 3.2</div>
+                    </div>
+                    <div class="source-legend-item" data-source="gpt4">
+                        <div class="source-indicator gpt4"></div>
+                        <div class="legend-text">GPT-4o Mini</div>
+                    </div>
+                </div>
+                <div class="legend-section">
+                    <div class="legend-section-title">Multi-Label</div>
+                    <div class="legend-item">
+                        <div class="legend-color multi-type" style="--color1: #FF6B6B; --color2: #4ECDC4;"></div>
+                        <div class="legend-text">Multiple Types</div>
+                    </div>
+                </div>
+            </div>
+        </div>
+"""
+        
+        # Process JSONL file
+        mistral_total, gpt4_total = ComparisonResult(), ComparisonResult()
+        text_count = 0
+        tag_specs = {}  # entity tags used by browser-rendered passages
+        
+        # Passages are rendered independently (possibly in worker processes)
+        # and written here in input order
+        results = self._map_lines([line for _, line in numbered_lines])
+        for (line_num, _), (status, payload) in zip(numbered_lines, results):
+            if status == _PARSE_ERROR:
+                yield f'<p style="color: red;">Error parsing line {line_num}: {payload}</p>\n'
+                continue
+            
+            text_count += 1
+            if status == _PROCESS_ERROR:
+                yield f'<p style="color: red;">Error processing line {line_num}: {payload}</p>\n'
+                continue
+            
+            (gt_count, gt_html, mistral_count, mistral_html, gpt4_count, gpt4_html,
+             client_data, mistral_comparison, gpt4_comparison) = payload
+            
+            # Add to HTML
+            if not self.summary_only:
+                yield _PASSAGE_TMPL.format(
+                    text_count=text_count,
+                    gt_len=gt_count, gt_marked=gt_html,
+                    mistral_len=mistral_count, mistral_marked=mistral_html,
+                    gpt4_len=gpt4_count, gpt4_marked=gpt4_html,
+                )
+                
+                if client_data is not None:
+                    passage_json, specs = client_data
+                    tag_specs.update(specs)
+                    yield f'            <script type="application/json" class="passage-data">{passage_json}</script>\n'
+                
+                yield """
+         </div>
+"""
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            # Accumulate totals
+            mistral_total += mistral_comparison
+            gpt4_total += gpt4_comparison
+        
+        # Add overall summary: precision, recall and F1 per model
+        mp = mistral_total.exact_matches / max(mistral_total.total_model, 1)
+        mr = mistral_total.exact_matches / max(mistral_total.total_ground_truth, 1)
+        mf1 = 2 * mp * mr / max(mp + mr, 0.001)
+        gp = gpt4_total.exact_matches / max(gpt4_total.total_model, 1)
+        gr = gpt4_total.exact_matches / max(gpt4_total.total_ground_truth, 1)
+        gf1 = 2 * gp * gr / max(gp + gr, 0.001)
+        
+        yield _SUMMARY_TMPL.format(
+            text_count=text_count,
+            mistral_total_model=mistral_total.total_model,
+            gpt4_total_model=gpt4_total.total_model,
+            total_ground_truth=mistral_total.total_ground_truth,
+            mistral_exact=mistral_total.exact_matches,
+            gpt4_exact=gpt4_total.exact_matches,
+            mistral_precision=mp,
+            gpt4_precision=gp,
+            mistral_recall=mr,
+            gpt4_recall=gr,
+            mistral_f1=mf1,
+            gpt4_f1=gf1,
+        )
+        
+        if self.client_render and not self.summary_only:
+            # Always ship the table and script, or passages without entities stay blank
+            tags = {key: self._get_entity_tags(source, types) for key, (source, types) in tag_specs.items()}
+            tags_json = json.dumps(tags, ensure_ascii=False).replace('<', '\\u003c')
+            yield f'        <script type="application/json" id="entity-tags">{tags_json}</script>\n'
+            yield _CLIENT_RENDER_SCRIPT
+        
+        yield _HTML_FOOTER
+
+    def convert_file(self, input_file: str, output_file: str):
+        """Convert JSONL file to HTML report; an output of '-' writes to stdout."""
+        # Status goes to stderr so the report itself can be piped
+        print(f"Converting {input_file} to {output_file}...", file=sys.stderr)
+        
+        try:
+            # Read the input before opening (and truncating) the output
+            chunks = self.iter_html_report(input_file)
+            if output_file == '-':
+                self._write_report(chunks, sys.stdout)
+            else:
+                with open(output_file, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+                    self._write_report(chunks, f)
             
-            print(f"✅ Successfully created HTML report: {output_file}")
-            print(f"📊 Open the file in your web browser to view the results")
+            print(f"✅ Successfully created HTML report: {output_file}", file=sys.stderr)
+            print(f"📊 Open the file in your web browser to view the results", file=sys.stderr)
             
         except Exception as e:
-            print(f"❌ Error converting file: {e}")
+            print(f"❌ Error converting file: {e}", file=sys.stderr)
             raise
 
+    def _write_report(self, chunks: Iterator[str], out: TextIO):
+        """Stream the report to ``out``, closing off a partial report if generation fails."""
+        try:
+            out.writelines(chunks)
+        except Exception as e:
+            out.write(f'<p style="color: red;">Report aborted: {html.escape(str(e))}</p>\n</body>\n</html>\n')
+            raise
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 
 def main():
     parser = argparse.ArgumentParser(
         description="Convert JSONL entity extraction results to HTML report"
     )
     parser.add_argument("input", help="Input JSONL file")
-    parser.add_argument("output", help="Output HTML file")
+    parser.add_argument("output", help="Output HTML file ('-' for stdout)")
+    parser.add_argument("-j", "--workers", type=_positive_int, default=None,
+                        help="Number of worker processes (default: all CPUs, 1 disables multiprocessing)")
+    parser.add_argument("--summary-only", action="store_true",
+                        help="Only report the overall summary, without the marked-up passages")
+    parser.add_argument("--client-render", action="store_true",
+                        help="Embed each passage once and highlight it in the browser (smaller report)")
     
     args = parser.parse_args()
     
-    converter = EntityMarkupConverter()
+    converter = EntityMarkupConverter(max_workers=args.workers, summary_only=args.summary_only,
+                                      client_render=args.client_render)
     converter.convert_file(args.input, args.output)
 
 